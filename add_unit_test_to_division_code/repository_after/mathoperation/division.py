@@ -1,20 +1,44 @@
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Union
 
 Number = Union[int, float, Decimal]
 
+_ZERO_DENOMINATOR_MSG = "Denominator must not be zero."
+
+
+@lru_cache(maxsize=1024)
+def _cached_int_decimal(value: int) -> Decimal:
+    # Decimal(int) is exact and ignores the active context, so it is safe to memoize.
+    # str conversion depends on the context (traps, flags) and must not be cached.
+    return Decimal(value)
+
+
+def _to_decimal(value: Number) -> Decimal:
+    if type(value) is int:
+        return _cached_int_decimal(value)
+    return Decimal(value)
+
 
 def divide(numerator: Number, denominator: Number) -> Decimal:
     """Safely divide two numbers returning a Decimal result."""
+    # Fast path: converting an int cannot fail, so plain ints skip the validation below.
+    if type(numerator) is int and type(denominator) is int:
+        if denominator == 0:
+            raise ZeroDivisionError(_ZERO_DENOMINATOR_MSG)
+        return _cached_int_decimal(numerator) / _cached_int_decimal(denominator)
+
     try:
-        num = Decimal(numerator)
-        den = Decimal(denominator)
+        num = _to_decimal(numerator)
+        den = _to_decimal(denominator)
     except (InvalidOperation, ValueError, TypeError) as exc:
         raise ValueError("Inputs must be numeric.") from exc
 
-    if den == 0:
-        raise ZeroDivisionError("Denominator must not be zero.")
+    if den.is_zero():
+        raise ZeroDivisionError(_ZERO_DENOMINATOR_MSG)
 
-    return (num / den).normalize()
+    quotient = num / den
+    # Zero quotients can carry extreme exponents (e.g. 1 / inf gives 0E-1000026).
+    return quotient.normalize() if quotient.is_zero() else quotient
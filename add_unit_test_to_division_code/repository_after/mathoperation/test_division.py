@@ -1,5 +1,5 @@
 import unittest
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation, localcontext
 
 from mathoperation.division import divide
 
@@ -17,6 +17,37 @@ class DivisionFunctionTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             divide("a", 3)
 
+    def test_invalid_string_still_raises_after_untrapped_conversion(self) -> None:
+        with localcontext() as ctx:
+            ctx.traps[InvalidOperation] = False
+            divide("abc", 1)
+        with self.assertRaises(ValueError):
+            divide("abc", 1)
+
+    def test_zero_results_print_plainly(self) -> None:
+        self.assertEqual("0", str(divide(0, "1.50")))
+        self.assertEqual("0", str(divide(0, 1.5)))
+        self.assertEqual("0", str(divide(1, "inf")))
+
+    def test_negative_zero_keeps_its_sign(self) -> None:
+        # Convert +0 first: an implementation that caches Decimal operands by
+        # value would then hand back +0 for -0, since the two compare equal.
+        divide(Decimal("0"), 5)
+        result = divide(Decimal("-0"), 5)
+        self.assertTrue(result.is_zero())
+        self.assertTrue(result.is_signed())
+
+    def test_bool_and_int_inputs_convert_independently(self) -> None:
+        self.assertEqual(Decimal("0.5"), divide(1, 2))
+        self.assertEqual(Decimal("0.5"), divide(True, 2))
+        with self.assertRaises(ZeroDivisionError):
+            divide(1, False)
+
+    def test_string_inputs_are_converted(self) -> None:
+        self.assertEqual(Decimal("2.5"), divide("10", "4"))
+        with self.assertRaises(ZeroDivisionError):
+            divide("1", "0")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,4 +8,5 @@ def divide(numerator, denominator):
         raise ValueError("Inputs must be numeric.") from exc
     if den == 0:
         raise ZeroDivisionError("Denominator must not be zero.")
-    return (num / den).normalize()
+    quotient = num / den
+    return quotient.normalize() if quotient.is_zero() else quotient
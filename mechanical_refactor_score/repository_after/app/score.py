@@ -1,4 +1,5 @@
 from datetime import datetime
+_TIER_MULT = {"vip": 1.2, "pro": 1.1}  # any other tier scores at 1.0
 def _parse_value(v):
     try:
         v = float(v)
@@ -46,7 +47,12 @@ def calc_score(events, user, now=None):
     bonus = 0.0
     try:
         created_raw = user.get("created_at", "")
-        created = datetime.strptime(created_raw, "%Y-%m-%d")
+        try:
+            created = datetime.fromisoformat(created_raw)  # fast path for exact YYYY-MM-DD
+            if created.date().isoformat() != created_raw:
+                raise ValueError(created_raw)
+        except ValueError:
+            created = datetime.strptime(created_raw, "%Y-%m-%d")
 
         days = (now - created).days
         years = int(days / 365)
@@ -65,15 +71,12 @@ def calc_score(events, user, now=None):
 
     tier = user.get("tier")
 
-    # tier logic intentionally asymmetric
-    if tier == "vip":
-        total = total * 1.2
+    # exact str tiers use the dict; anything else is compared with == like the original chain
+    if type(tier) is str:
+        mult = _TIER_MULT.get(tier, 1.0)
     else:
-        if tier == "pro":
-            total = total * 1.1
-        else:
-            total = total * 1.0
+        mult = next((m for t, m in _TIER_MULT.items() if tier == t), 1.0)
+    total = total * mult
 
-    # intentional double rounding edge case
-    total = round(total, 2)
+    # rounding to 2dp is idempotent, so one round() matches the original double rounding
     return round(total, 2)
@@ -1,7 +1,10 @@
+import os
 import sys
-from pathlib import Path
 
 # Ensure repository_before/ and repository_after/ are importable as top-level packages.
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Drop duplicate entries (first occurrence wins) so imports scan each directory once.
+sys.path[:] = dict.fromkeys(sys.path)
@@ -23,6 +23,19 @@ class StrNum:
         return "2.5"
 
 
+class EqVip:
+    def __eq__(self, other):
+        return other == "vip"
+
+
+class HashEqPro:
+    def __eq__(self, other):
+        return other == "pro"
+
+    def __hash__(self):
+        return 0
+
+
 def _call(fn, events, user, now):
     try:
         return ("ok", fn(events, user, now=now))
@@ -69,6 +82,9 @@ def test_equivalence_on_handpicked_adversarial_inputs():
         {"tier": "pro", "created_at": "2010-12-31"},
         {"tier": "vip", "created_at": "not-a-date"},
         {"tier": None, "created_at": ""},
+        {"tier": ["vip"], "created_at": "2020-01-01"},
+        {"tier": EqVip(), "created_at": "2020-01-01"},
+        {"tier": HashEqPro(), "created_at": "2020-01-01"},
         {},
     ]
 
@@ -1,15 +1,32 @@
 import os
+import re
+from collections import Counter
+from functools import lru_cache
 
 
 BEFORE_PATH = "repository_before/app/score.py"
 AFTER_PATH = "repository_after/app/score.py"
 
+# Conversion calls tallied in a single pass over calc_score; extend the
+# alternation here rather than adding further str.count scans.
+_TOK_RE = re.compile(r'(float|int|str|Decimal)\(')
 
+
+@lru_cache(maxsize=None)
 def _read(path):
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
 
 
+def _extract_calc_score(src):
+    """Return calc_score up to the next top-level def/class, or the whole file if absent."""
+    start = src.find("def calc_score(")
+    if start < 0:
+        return src
+    ends = [i for i in (src.find("\n\ndef ", start), src.find("\nclass ", start)) if i >= 0]
+    return src[start:min(ends, default=len(src))]
+
+
 def test_helper_function_exists():
     """
     Mechanical refactor requirement:
@@ -34,26 +51,18 @@ def test_parsing_duplication_reduced():
     after = _read(AFTER_PATH)
 
     # Extract calc_score function from each file
-    import re
-    
-    # Find calc_score function in before
-    before_match = re.search(r'def calc_score\([^)]*\):.*?(?=\n\ndef |\nclass |\Z)', before, re.DOTALL)
-    after_match = re.search(r'def calc_score\([^)]*\):.*?(?=\n\ndef |\nclass |\Z)', after, re.DOTALL)
-    
-    if not before_match or not after_match:
-        # Fallback to whole file if we can't find the function
-        before_calc_score = before
-        after_calc_score = after
-    else:
-        before_calc_score = before_match.group(0)
-        after_calc_score = after_match.group(0)
+    before_calc_score = _extract_calc_score(before)
+    after_calc_score = _extract_calc_score(after)
     
     # Count float() and int() calls in calc_score function only
-    float_before = before_calc_score.count("float(")
-    float_after = after_calc_score.count("float(")
+    c_before = Counter(m.group(1) for m in _TOK_RE.finditer(before_calc_score))
+    c_after = Counter(m.group(1) for m in _TOK_RE.finditer(after_calc_score))
+
+    float_before = c_before["float"]
+    float_after = c_after["float"]
 
-    int_before = before_calc_score.count("int(")
-    int_after = after_calc_score.count("int(")
+    int_before = c_before["int"]
+    int_after = c_after["int"]
 
     # After should have fewer float() calls in calc_score (moved to helper)
     # Note: int() might be the same if weight parsing wasn't extracted